@@ -1,5 +1,7 @@
+from collections import deque
 import firedrake
-from firedrake.petsc import PETSc
+from firedrake.petsc import OptionsManager, PETSc
+from mpi4py import MPI
 from pyadjoint import no_annotations
 import ufl
 import numpy as np
@@ -64,6 +66,10 @@ class MongeAmpereMover_Base(PrimeMover):
         :kwarg rtol: relative tolerance for the residual
         :kwarg dtol: divergence tolerance for the residual
         :kwarg fix_boundary_nodes: should all boundary nodes remain fixed?
+        :kwarg print_freq: frequency with which to print progress
+        :kwarg symbolic_monitor: does the monitor function only depend on the
+            mesh symbolically, through its :class:`SpatialCoordinate`? If so,
+            its expression is only built once and reused.
         """
         if monitor_function is None:
             raise ValueError("Please supply a monitor function")
@@ -74,6 +80,12 @@ class MongeAmpereMover_Base(PrimeMover):
         self.rtol = kwargs.pop("rtol", 1.0e-08)
         self.dtol = kwargs.pop("dtol", 2.0)
         self.fix_boundary_nodes = kwargs.pop("fix_boundary_nodes", False)
+        self.print_freq = kwargs.pop("print_freq", 1)
+        if not isinstance(self.print_freq, int) or self.print_freq <= 0:
+            raise ValueError(
+                f"Print frequency must be a positive integer, not {self.print_freq}."
+            )
+        self.symbolic_monitor = kwargs.pop("symbolic_monitor", False)
         super().__init__(mesh, monitor_function=monitor_function)
 
         # Create function spaces
@@ -81,19 +93,32 @@ class MongeAmpereMover_Base(PrimeMover):
         self.P1 = firedrake.FunctionSpace(self.mesh, "CG", 1)
         self.P1_vec = firedrake.VectorFunctionSpace(self.mesh, "CG", 1)
         self.P1_ten = firedrake.TensorFunctionSpace(self.mesh, "CG", 1)
+        self.R = firedrake.FunctionSpace(self.mesh, "R", 0)
 
         # Create objects used during the mesh movement
-        self.theta = firedrake.Constant(0.0)
+        self.theta = firedrake.Function(self.R, name="Normalisation coefficient")
         self.monitor = firedrake.Function(self.P1, name="Monitor function")
-        self.monitor.interpolate(self.monitor_function(self.mesh))
+        self._interpolate_monitor()
         self.volume = firedrake.Function(self.P0, name="Mesh volume")
         self.volume.interpolate(ufl.CellVolume(self.mesh))
         self.original_volume = firedrake.Function(self.volume)
+        self._original_volume_inv = 1.0 / self.original_volume.dat.data_ro
         self.total_volume = firedrake.assemble(firedrake.Constant(1.0) * self.dx)
         self.L_P0 = firedrake.TestFunction(self.P0) * self.monitor * self.dx
         self._grad_phi = firedrake.Function(self.P1_vec)
         self.grad_phi = firedrake.Function(self.mesh.coordinates)
 
+        # Decide once how the recovered gradient is transferred to the
+        # coordinate space, rather than on every update
+        self._direct_copy = (
+            self._grad_phi.function_space().ufl_element()
+            == self.grad_phi.function_space().ufl_element()
+        )
+        if not self._direct_copy:
+            self._grad_phi_interpolator = firedrake.Interpolator(
+                self._grad_phi, self.coord_space
+            )
+
     @PETSc.Log.EventDecorator("MongeAmpereBase.apply_initial_guess")
     def apply_initial_guess(self, phi_init=None, sigma_init=None, **kwargs):
         """
@@ -119,8 +144,81 @@ class MongeAmpereMover_Base(PrimeMover):
         elif phi_init is not None or sigma_init is not None:
             raise ValueError("Need to initialise both phi *and* sigma")
 
+    @PETSc.Log.EventDecorator("MongeAmpereBase.setup_residuals")
+    def _setup_residuals(self):
+        r"""
+        Setup the normalisation coefficient and residual forms.
+
+        The term :math:`m(x)\det(I + H(\phi))` is shared between them,
+        so it is interpolated into a single P1 :class:`Function`, which is
+        then used for each of them.
+
+        Since the residual is P1, its L2 projection is evaluated as the
+        action of a precomputed P1 mass matrix, rather than by assembly.
+        """
+        assert hasattr(self, "sigma_old")
+        I = ufl.Identity(self.dim)
+        self._detform = firedrake.Function(self.P1)
+        self._detform_interpolator = firedrake.Interpolator(
+            self.monitor * ufl.det(I + self.sigma_old), self.P1
+        )
+        self.residual = self._detform - self.theta
+        psi = firedrake.TestFunction(self.P1)
+        self._mass_P1 = firedrake.assemble(
+            psi * firedrake.TrialFunction(self.P1) * self.dx, mat_type="aij"
+        )
+        self._mass_P1_one = firedrake.assemble(psi * self.dx)
+        with self._mass_P1_one.dat.vec_ro as w:
+            self._mass_P1_one_norm = w.norm()
+        self._residual_l2 = self._mass_P1.petscmat.createVecLeft()
+
+    @PETSc.Log.EventDecorator("MongeAmpereBase.update_theta")
+    def _update_theta(self):
+        """
+        Update the shared determinant term and use it to evaluate
+        the normalisation coefficient.
+
+        Since the determinant term is P1, its integral is given exactly
+        by a dot product with the precomputed integrals of the P1 basis
+        functions, so no assembly is required.
+        """
+        self._detform_interpolator.interpolate(output=self._detform)
+        with self._detform.dat.vec_ro as detform, self._mass_P1_one.dat.vec_ro as w:
+            self.theta.assign(w.dot(detform) / self.total_volume)
+
+    @PETSc.Log.EventDecorator("MongeAmpereBase.interpolate_monitor")
+    def _interpolate_monitor(self):
+        """
+        Interpolate the monitor function on the current mesh.
+
+        By default, the monitor function is called on every update, since
+        it may do numerical work on the current mesh. If the monitor is
+        flagged as symbolic, i.e. it only depends on the mesh through its
+        :class:`SpatialCoordinate`, then the expression and its
+        :class:`Interpolator` are cached and only rebuilt if the monitor
+        function has been changed, so that the compiled kernel is reused.
+        """
+        if not self.symbolic_monitor:
+            self.monitor.interpolate(self.monitor_function(self.mesh))
+            return
+        cached_function = getattr(self, "_monitor_interpolator_function", None)
+        if cached_function != self.monitor_function:
+            expr = self.monitor_function(self.mesh)
+            self._monitor_interpolator = firedrake.Interpolator(expr, self.P1)
+            self._monitor_interpolator_function = self.monitor_function
+        self._monitor_interpolator.interpolate(output=self.monitor)
+
+    @PETSc.Log.EventDecorator("MongeAmpereBase.update_volume")
+    def _update_volume(self):
+        """
+        Compute the monitor-weighted element volumes of the current
+        mesh, relative to the original element volumes.
+        """
+        firedrake.assemble(self.L_P0, tensor=self.volume)
+        self.volume.dat.data[:] *= self._original_volume_inv
+
     @property
-    @PETSc.Log.EventDecorator()
+    @PETSc.Log.EventDecorator("MongeAmpereBase.diagnostics")
     def _diagnostics(self):
         """
         Compute the following diagnostics:
@@ -128,19 +226,39 @@ class MongeAmpereMover_Base(PrimeMover):
           2) coefficient of variation (σ/μ) of element volumes;
           3) relative L2 norm residual.
         """
-        v = self.volume.vector().gather()
-        minmax = v.min() / v.max()
-        mean = v.sum() / v.max()
-        w = v.copy() - mean
-        w *= w
-        std = np.sqrt(w.sum() / w.size)
+        with self.volume.dat.vec_ro as v:
+            vmin = v.min()[1]
+            vmax = v.max()[1]
+            size = v.getSize()
+            local = v.array_r
+            moments = np.array([local.sum(), np.dot(local, local)])
+        self.mesh.comm.Allreduce(MPI.IN_PLACE, moments, op=MPI.SUM)
+        vsum, vsqsum = moments
+        minmax = vmin / vmax
+        mean = vsum / vmax
+        # E[(v - mean)^2] = E[v^2] - 2 mean E[v] + mean^2
+        var = (vsqsum - 2.0 * mean * vsum) / size + mean * mean
+        std = np.sqrt(max(var, 0.0))
         cv = std / mean
-        assert hasattr(self, "_residual_l2_form")
-        assert hasattr(self, "_norm_l2_form")
-        residual_l2 = firedrake.assemble(self._residual_l2_form).dat.norm
-        norm_l2 = firedrake.assemble(self._norm_l2_form).dat.norm
-        residual_l2_rel = residual_l2 / norm_l2
-        return minmax, residual_l2_rel, cv
+        return minmax, self._relative_residual(), cv
+
+    @PETSc.Log.EventDecorator("MongeAmpereBase.relative_residual")
+    def _relative_residual(self):
+        """
+        Compute the relative L2 norm of the residual.
+
+        Since the residual is P1, its L2 projection is evaluated as the
+        action of the precomputed P1 mass matrix.
+        """
+        assert hasattr(self, "_mass_P1")
+        theta = self.theta.dat.data_ro[0]
+        r = self._residual_l2
+        with self._detform.dat.vec_ro as detform, self._mass_P1_one.dat.vec_ro as w:
+            self._mass_P1.petscmat.mult(detform, r)
+            r.axpy(-theta, w)  # M(m det(I + H(φ)) - θ)
+        residual_l2 = r.norm()
+        norm_l2 = abs(theta) * self._mass_P1_one_norm
+        return residual_l2 / norm_l2
 
     @property
     @PETSc.Log.EventDecorator("MongeAmpereBase.update_coordinates")
@@ -149,13 +267,72 @@ class MongeAmpereMover_Base(PrimeMover):
         Update the coordinate :class:`Function` using
         the recovered gradient.
         """
-        try:
-            self.grad_phi.assign(self._grad_phi)
-        except Exception:
-            self.grad_phi.interpolate(self._grad_phi)
-        self._x.assign(self.xi + self.grad_phi)  # x = ξ + grad(φ)
+        self._update_coordinates(self._x)
         return self._x
 
+    def _update_coordinates(self, target):
+        """
+        Evaluate the physical coordinates using the recovered
+        gradient and write them into a coordinate :class:`Function`.
+
+        :arg target: the coordinate :class:`Function` to update
+        """
+        self._update_grad_phi()
+        xi, grad_phi = self.xi.dat.data_ro, self.grad_phi.dat.data_ro
+        np.add(xi, grad_phi, out=target.dat.data)  # x = ξ + grad(φ)
+
+    def _update_grad_phi(self):
+        """
+        Transfer the recovered gradient to the coordinate space.
+        """
+        if self._direct_copy:
+            np.copyto(self.grad_phi.dat.data, self._grad_phi.dat.data_ro)
+        else:
+            self._grad_phi_interpolator.interpolate(output=self.grad_phi)
+
+    @PETSc.Log.EventDecorator("MongeAmpereBase.move_to_physical_mesh")
+    def _move_to_physical_mesh(self):
+        """
+        Set the mesh coordinates to the physical coordinates
+        in place, using the recovered gradient.
+
+        This avoids forming :attr:`x` and copying it into the mesh.
+        """
+        self._update_coordinates(self.mesh.coordinates)
+
+    @PETSc.Log.EventDecorator("MongeAmpereBase.boundary_normal_integrals")
+    def _boundary_normal_integrals(self):
+        """
+        Compute the integral of the absolute value of each component
+        of the outward unit normal over each tagged boundary segment.
+
+        A single assembly is performed over a trace space and the
+        resulting facet values are aggregated by boundary tag.
+
+        :return: dictionary mapping boundary tags to arrays of integrals
+        """
+        n = ufl.FacetNormal(self.mesh)
+        abs_n = ufl.as_vector([abs(n[j]) for j in range(self.dim)])
+        P0_trace_vec = firedrake.VectorFunctionSpace(self.mesh, "HDiv Trace", 0)
+        test = firedrake.TestFunction(P0_trace_vec)
+        facet_values = firedrake.assemble(ufl.inner(abs_n, test) * self.ds)
+        facet_values = facet_values.dat.data_ro_with_halos
+
+        # Find the trace DoF associated with each locally owned exterior facet
+        exterior_facets = self.mesh.exterior_facets
+        num_facets = exterior_facets.set.size
+        local_facets = exterior_facets.local_facet_dat.data_ro.reshape(-1)
+        cell_nodes = P0_trace_vec.exterior_facet_node_map().values
+        nodes = cell_nodes[np.arange(num_facets), local_facets[:num_facets]]
+
+        # Sum the facet contributions for each boundary tag
+        tags = np.array(exterior_facets.unique_markers)
+        markers = exterior_facets.markers[:num_facets]
+        integrals = np.zeros((len(tags), self.dim))
+        np.add.at(integrals, np.searchsorted(tags, markers), facet_values[nodes])
+        self.mesh.comm.Allreduce(MPI.IN_PLACE, integrals, op=MPI.SUM)
+        return dict(zip(tags, integrals))
+
     @property
     @PETSc.Log.EventDecorator("MongeAmpereBase.create_l2_projector")
     def l2_projector(self):
@@ -178,13 +355,15 @@ class MongeAmpereMover_Base(PrimeMover):
         # Enforce no movement normal to boundary
         n = ufl.FacetNormal(self.mesh)
         bcs = []
+        if not self.fix_boundary_nodes:
+            normals = self._boundary_normal_integrals()
         for i in self.mesh.exterior_facets.unique_markers:
             if self.fix_boundary_nodes:
                 bcs.append(firedrake.DirichletBC(self.P1_vec, 0, i))
                 continue
 
             # Check for axis-aligned boundaries
-            _n = [firedrake.assemble(abs(n[j]) * self.ds(i)) for j in range(self.dim)]
+            _n = normals[i]
             if np.allclose(_n, 0.0):
                 raise ValueError(f"Invalid normal vector {_n}")
             else:
@@ -232,6 +411,57 @@ class MongeAmpereMover_Base(PrimeMover):
         return self._l2_projector
 
 
+class _ComponentwiseMassSolver(object):
+    """
+    Solver for L2 projections into a vector or tensor P1 space.
+
+    The mass matrix of such a space is block diagonal, with one copy of
+    the scalar P1 mass matrix per component. It is therefore assembled
+    and set up only once, in the scalar space, and reused to solve for
+    each component in turn.
+    """
+
+    def __init__(self, L, u, mass, solver_parameters=None, options_prefix=None):
+        """
+        :arg L: the linear form defining the right-hand side
+        :arg u: the :class:`Function` to hold the solution
+        :arg mass: the assembled scalar P1 mass matrix
+        :kwarg solver_parameters: parameters for the scalar mass matrix solver
+        :kwarg options_prefix: PETSc options prefix for the solver
+        """
+        self.L = L
+        self.u = u
+        self.mass = mass
+        self.ksp = PETSc.KSP().create(comm=mass.petscmat.getComm())
+        self.ksp.setOperators(self.mass.petscmat)
+        self._options = OptionsManager(solver_parameters or {}, options_prefix)
+        self._options.set_from_options(self.ksp)
+        self._x, self._b = self.mass.petscmat.createVecs()
+        self._rhs = None
+
+    @PETSc.Log.EventDecorator("ComponentwiseMassSolver.solve")
+    def solve(self):
+        """
+        Assemble the right-hand side and solve for each component.
+        """
+        self._rhs = firedrake.assemble(self.L, tensor=self._rhs)
+        rhs = self._rhs.dat.data_ro
+        u = self.u.dat.data
+        for index in np.ndindex(rhs.shape[1:]):
+            component = (slice(None),) + index
+            self._b.array[:] = rhs[component]
+            with self._options.inserted_options():
+                self.ksp.solve(self._b, self._x)
+            reason = self.ksp.getConvergedReason()
+            if reason < 0:
+                raise firedrake.ConvergenceError(
+                    f"Mass matrix solve failed to converge for component {index}"
+                    f" after {self.ksp.getIterationNumber()} iterations"
+                    f" with reason {reason}."
+                )
+            u[component] = self._x.array_r
+
+
 class MongeAmpereMover_Relaxation(MongeAmpereMover_Base):
     r"""
         The elliptic Monge-Ampere equation is solved in a parabolised
@@ -263,8 +493,21 @@ class MongeAmpereMover_Relaxation(MongeAmpereMover_Base):
         :kwarg maxiter: maximum number of iterations for the relaxation
         :kwarg rtol: relative tolerance for the residual
         :kwarg dtol: divergence tolerance for the residual
+        :kwarg offload: should the pseudo-timestepper preconditioner be
+            offloaded to the GPU?
+        :kwarg anderson_depth: number of previous iterates to use for Anderson
+            acceleration of the relaxation (zero for no acceleration)
+        :kwarg matfree: should the pseudo-timestepper operator be applied
+            matrix-free?
         """
         self.pseudo_dt = firedrake.Constant(kwargs.pop("pseudo_timestep", 0.1))
+        self.offload = kwargs.pop("offload", False)
+        self.anderson_depth = kwargs.pop("anderson_depth", 0)
+        if self.anderson_depth < 0:
+            raise ValueError(
+                f"Anderson depth must be non-negative, not {self.anderson_depth}."
+            )
+        self.matfree = kwargs.pop("matfree", False)
         super().__init__(mesh, monitor_function=monitor_function, **kwargs)
 
         # Create functions to hold solution data
@@ -277,12 +520,12 @@ class MongeAmpereMover_Relaxation(MongeAmpereMover_Base):
         self.apply_initial_guess(**kwargs)
 
         # Setup residuals
-        I = ufl.Identity(self.dim)
-        self.theta_form = self.monitor * ufl.det(I + self.sigma_old) * self.dx
-        self.residual = self.monitor * ufl.det(I + self.sigma_old) - self.theta
-        psi = firedrake.TestFunction(self.P1)
-        self._residual_l2_form = psi * self.residual * self.dx
-        self._norm_l2_form = psi * self.theta * self.dx
+        self._setup_residuals()
+
+        # Setup solvers up front, rather than during the first iteration
+        self.l2_projector
+        self.pseudotimestepper
+        self.equidistributor
 
     @property
     @PETSc.Log.EventDecorator("MongeAmpereMover.create_pseudotimestepper")
@@ -301,11 +544,42 @@ class MongeAmpereMover_Relaxation(MongeAmpereMover_Base):
             ufl.inner(ufl.grad(psi), ufl.grad(self.phi_old)) * self.dx
             + self.pseudo_dt * psi * self.residual * self.dx
         )
-        problem = firedrake.LinearVariationalProblem(a, L, self.phi)
+        problem = firedrake.LinearVariationalProblem(
+            a,
+            L,
+            self.phi,
+            constant_jacobian=True,
+        )
         sp = {
             "ksp_type": "cg",
+            "ksp_norm_type": "unpreconditioned",
+            "ksp_rtol": 1.0e-08,
+        }
+        pc = {
             "pc_type": "gamg",
+            "pc_gamg_type": "agg",
+            "pc_gamg_agg_nsmooths": 1,
+            "pc_gamg_reuse_interpolation": True,
+            "pc_gamg_square_graph": 1,
+            "pc_gamg_threshold": 0.02,
+            "mg_levels_ksp_type": "chebyshev",
+            "mg_levels_ksp_max_it": 2,
+            "mg_levels_pc_type": "jacobi",
+            "mg_levels_esteig_ksp_type": "cg",
+            "mg_levels_esteig_ksp_max_it": 10,
         }
+        if self.offload:
+            # Apply the preconditioner on the GPU, keeping assembly on the CPU
+            sp["pc_type"] = "python"
+            sp["pc_python_type"] = "firedrake.OffloadPC"
+            sp.update({f"offload_{key}": value for key, value in pc.items()})
+        else:
+            sp.update(pc)
+        if self.matfree:
+            # Apply the operator matrix-free, only assembling it as an AIJ
+            # preconditioning matrix for GAMG
+            sp["mat_type"] = "matfree"
+            sp["pmat_type"] = "aij"
         nullspace = firedrake.VectorSpaceBasis(constant=True)
         self._pseudotimestepper = firedrake.LinearVariationalSolver(
             problem,
@@ -313,6 +587,10 @@ class MongeAmpereMover_Relaxation(MongeAmpereMover_Base):
             nullspace=nullspace,
             transpose_nullspace=nullspace,
         )
+
+        # The Laplace operator is the same for every pseudo-timestep, so the
+        # GAMG hierarchy only needs to be built once
+        self._pseudotimestepper.snes.ksp.setReusePreconditioner(True)
         return self._pseudotimestepper
 
     @property
@@ -325,28 +603,53 @@ class MongeAmpereMover_Relaxation(MongeAmpereMover_Base):
             return self._equidistributor
         assert hasattr(self, "phi")
         assert hasattr(self, "sigma")
+        assert hasattr(self, "_mass_P1")
         if self.dim != 2:
             raise NotImplementedError  # TODO
         n = ufl.FacetNormal(self.mesh)
-        sigma = firedrake.TrialFunction(self.P1_ten)
         tau = firedrake.TestFunction(self.P1_ten)
-        a = ufl.inner(tau, sigma) * self.dx
         L = (
             -ufl.dot(ufl.div(tau), ufl.grad(self.phi)) * self.dx
             + (tau[0, 1] * n[1] * self.phi.dx(0) + tau[1, 0] * n[0] * self.phi.dx(1))
             * self.ds
         )
-        problem = firedrake.LinearVariationalProblem(a, L, self.sigma)
         sp = {
             "ksp_type": "cg",
+            "ksp_rtol": 1.0e-07,
             "pc_type": "bjacobi",
             "sub_pc_type": "ilu",
         }
-        self._equidistributor = firedrake.LinearVariationalSolver(
-            problem, solver_parameters=sp
+        self._equidistributor = _ComponentwiseMassSolver(
+            L,
+            self.sigma,
+            self._mass_P1,
+            solver_parameters=sp,
+            options_prefix="equidistributor_",
         )
         return self._equidistributor
 
+    @PETSc.Log.EventDecorator("MongeAmpereMover.anderson_acceleration")
+    def _apply_anderson_acceleration(self):
+        """
+        Replace the output of the pseudo-timestepper with the Anderson
+        accelerated combination of the most recent fixed-point iterates.
+        """
+        g = self.phi.dat.data_ro.copy()
+        f = g - self.phi_old.dat.data_ro
+        self._anderson_history.append((g, f))
+        if len(self._anderson_history) < 2:
+            return
+        G, F = (np.array(a) for a in zip(*self._anderson_history))
+        dG, dF = np.diff(G, axis=0), np.diff(F, axis=0)
+
+        # Solve the small least squares problem via its normal equations
+        A = dF @ dF.T
+        b = dF @ f
+        self.mesh.comm.Allreduce(MPI.IN_PLACE, A, op=MPI.SUM)
+        self.mesh.comm.Allreduce(MPI.IN_PLACE, b, op=MPI.SUM)
+        gamma = np.linalg.lstsq(A, b, rcond=None)[0]
+        self.phi.dat.data[:] = g - gamma @ dG
+
     @PETSc.Log.EventDecorator("MongeAmpereMover.move")
     def move(self):
         """
@@ -356,44 +659,50 @@ class MongeAmpereMover_Relaxation(MongeAmpereMover_Base):
         assert hasattr(self, "sigma")
         assert hasattr(self, "phi_old")
         assert hasattr(self, "sigma_old")
+        self._anderson_history = deque(maxlen=self.anderson_depth + 1)
         for i in range(self.maxiter):
             # L2 project
             self.l2_projector.solve()
 
             # Update mesh coordinates
-            self.mesh.coordinates.assign(self.x)
+            self._move_to_physical_mesh()
 
             # Update monitor function
-            self.monitor.interpolate(self.monitor_function(self.mesh))
-            firedrake.assemble(self.L_P0, tensor=self.volume)
-            self.volume.interpolate(self.volume / self.original_volume)
+            self._interpolate_monitor()
+            self._update_volume()
             self.mesh.coordinates.assign(self.xi)
 
             # Evaluate normalisation coefficient
-            self.theta.assign(firedrake.assemble(self.theta_form) / self.total_volume)
+            self._update_theta()
 
             # Check convergence criteria
             minmax, residual, cv = self._diagnostics
             if i == 0:
                 initial_norm = residual
-            PETSc.Sys.Print(
-                f"{i:4d}"
-                f"   Min/Max {minmax:10.4e}"
-                f"   Residual {residual:10.4e}"
-                f"   Variation (σ/μ) {cv:10.4e}"
-            )
-            if residual < self.rtol:
+            converged = residual < self.rtol
+            diverged = residual > self.dtol * initial_norm
+            final = i == self.maxiter - 1
+            if i % self.print_freq == 0 or converged or diverged or final:
+                PETSc.Sys.Print(
+                    f"{i:4d}"
+                    f"   Min/Max {minmax:10.4e}"
+                    f"   Residual {residual:10.4e}"
+                    f"   Variation (σ/μ) {cv:10.4e}"
+                )
+            if converged:
                 PETSc.Sys.Print(f"Converged in {i+1} iterations.")
                 break
-            if residual > self.dtol * initial_norm:
+            if diverged:
                 raise firedrake.ConvergenceError(f"Diverged after {i+1} iterations.")
-            if i == self.maxiter - 1:
+            if final:
                 raise firedrake.ConvergenceError(
                     f"Failed to converge in {i+1} iterations."
                 )
 
             # Apply pseudotimestepper and equidistributor
             self.pseudotimestepper.solve()
+            if self.anderson_depth > 0:
+                self._apply_anderson_acceleration()
             self.equidistributor.solve()
             self.phi_old.assign(self.phi)
             self.sigma_old.assign(self.sigma)
@@ -436,6 +745,23 @@ class MongeAmpereMover_QuasiNewton(MongeAmpereMover_Base):
         self.apply_initial_guess(**kwargs)
 
         # Setup residuals
+        self._setup_residuals()
+
+        # Setup solvers up front, rather than during the first iteration
+        self.l2_projector
+        self.equidistributor
+
+    @PETSc.Log.EventDecorator("MongeAmpereMover.setup_residuals")
+    def _setup_residuals(self):
+        """
+        Setup the normalisation coefficient and residual forms.
+
+        Unlike the relaxation method, the determinant term is integrated
+        exactly, rather than via its P1 interpolant. This ensures that the
+        integral of the equidistributor residual vanishes, since it lies
+        in the transpose nullspace and so cannot be reduced by Newton.
+        """
+        assert hasattr(self, "sigma_old")
         I = ufl.Identity(self.dim)
         self.theta_form = self.monitor * ufl.det(I + self.sigma_old) * self.dx
         self.residual = self.monitor * ufl.det(I + self.sigma_old) - self.theta
@@ -443,6 +769,24 @@ class MongeAmpereMover_QuasiNewton(MongeAmpereMover_Base):
         self._residual_l2_form = psi * self.residual * self.dx
         self._norm_l2_form = psi * self.theta * self.dx
 
+    @PETSc.Log.EventDecorator("MongeAmpereMover.update_theta")
+    def _update_theta(self):
+        """
+        Update the normalisation coefficient.
+        """
+        self.theta.assign(firedrake.assemble(self.theta_form) / self.total_volume)
+
+    @PETSc.Log.EventDecorator("MongeAmpereMover.relative_residual")
+    def _relative_residual(self):
+        """
+        Compute the relative L2 norm of the residual.
+        """
+        assert hasattr(self, "_residual_l2_form")
+        assert hasattr(self, "_norm_l2_form")
+        residual_l2 = firedrake.assemble(self._residual_l2_form).dat.norm
+        norm_l2 = firedrake.assemble(self._norm_l2_form).dat.norm
+        return residual_l2 / norm_l2
+
     @property
     @PETSc.Log.EventDecorator("MongeAmpereMover.create_equidistributor")
     def equidistributor(self):
@@ -467,20 +811,23 @@ class MongeAmpereMover_QuasiNewton(MongeAmpereMover_Base):
         phi, sigma = firedrake.TrialFunctions(self.V)
 
         @PETSc.Log.EventDecorator("MongeAmpereMover.update_monitor")
-        def update_monitor(cursol):
+        def update_monitor(cursol, update_volume=False):
             """
             Callback for updating the monitor function.
+
+            If `update_volume` is set then the element volumes are
+            also updated, while the mesh is in its physical state.
             """
             assert hasattr(self, "phisigma_old")
             with self.phisigma_old.dat.vec as v:
                 cursol.copy(v)
             self.l2_projector.solve()
-            self.mesh.coordinates.assign(self.x)
-            self.monitor.interpolate(self.monitor_function(self.mesh))
+            self._move_to_physical_mesh()
+            self._interpolate_monitor()
+            if update_volume:
+                self._update_volume()
             self.mesh.coordinates.assign(self.xi)
-            self.theta.assign(
-                firedrake.assemble(self.theta_form) * self.total_volume ** (-1)
-            )
+            self._update_theta()
 
         # Custom preconditioner
         Jp = (
@@ -519,33 +866,61 @@ class MongeAmpereMover_QuasiNewton(MongeAmpereMover_Base):
             Note that convergence is not actually checked.
             """
             cursol = snes.getSolution()
-            update_monitor(cursol)
-            self.mesh.coordinates.assign(self.x)
-            firedrake.assemble(self.L_P0, tensor=self.volume)
-            self.volume.interpolate(self.volume / self.original_volume)
-            self.mesh.coordinates.assign(self.xi)
-            minmax, residual, cv = self._diagnostics
-            PETSc.Sys.Print(
-                f"{i:4d}"
-                f"   Min/Max {minmax:10.4e}"
-                f"   Residual {residual:10.4e}"
-                f"   Variation (σ/μ) {cv:10.4e}"
-            )
+            print_progress = i % self.print_freq == 0
+            update_monitor(cursol, update_volume=print_progress)
+            if print_progress:
+                self._print_progress(i)
 
         self.snes = self._equidistributor.snes
         self.snes.setMonitor(monitor)
         return self._equidistributor
 
+    def _print_progress(self, i):
+        """
+        Print the diagnostics for iteration `i` to screen.
+
+        The element volumes are assumed to be up to date.
+        """
+        minmax, residual, cv = self._diagnostics
+        PETSc.Sys.Print(
+            f"{i:4d}"
+            f"   Min/Max {minmax:10.4e}"
+            f"   Residual {residual:10.4e}"
+            f"   Variation (σ/μ) {cv:10.4e}"
+        )
+        self._last_printed = i
+
+    def _print_final_progress(self):
+        """
+        Print the diagnostics for the final iteration to screen,
+        if they were skipped due to the print frequency.
+
+        The monitor callback has already updated the potential and
+        monitor function, so only the element volumes need updating.
+        """
+        i = self.snes.getIterationNumber()
+        if i == self._last_printed:
+            return
+        self._move_to_physical_mesh()
+        self._update_volume()
+        self.mesh.coordinates.assign(self.xi)
+        self._print_progress(i)
+
     @PETSc.Log.EventDecorator("MongeAmpereMover.move")
     def move(self):
         """
         Run the quasi-Newton method to convergence and update the mesh.
         """
+        # The solver is created up front, so pick up any tolerance changes
+        self.equidistributor.snes.setTolerances(atol=self.rtol, max_it=self.maxiter)
+        self._last_printed = None
         try:
             self.equidistributor.solve()
+            self._print_final_progress()
             i = self.snes.getIterationNumber()
             PETSc.Sys.Print(f"Converged in {i} iterations.")
         except firedrake.ConvergenceError:
+            self._print_final_progress()
             i = self.snes.getIterationNumber()
             raise firedrake.ConvergenceError(f"Failed to converge in {i} iterations.")
         self.mesh.coordinates.assign(self.x)
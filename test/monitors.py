@@ -12,3 +12,11 @@ def ring_monitor(mesh):
     x, y = SpatialCoordinate(mesh)
     r = (x - 0.5) ** 2 + (y - 0.5) ** 2
     return Constant(1.0) + alpha / cosh(beta * (r - gamma)) ** 2
+
+
+def ring_monitor_numerical(mesh):
+    """
+    Ring monitor which is evaluated numerically on the current mesh.
+    """
+    P1 = FunctionSpace(mesh, "CG", 1)
+    return Function(P1).interpolate(ring_monitor(mesh))
@@ -90,6 +90,189 @@ def test_change_monitor(method, exports=False):
     assert np.allclose(coords, mover.mesh.coordinates.dat.data, atol=tol)
 
 
+def test_numerical_monitor(method, exports=False):
+    """
+    Test that a monitor function which does numerical
+    work on the current mesh is re-evaluated as the mesh
+    moves, giving the same result as its symbolic
+    counterpart.
+    """
+    n = 20
+    tol = 1.0e-03
+
+    mesh = UnitSquareMesh(n, n)
+    mover = MongeAmpereMover(mesh, ring_monitor, method=method, rtol=tol)
+    mover.move()
+    coords = mover.mesh.coordinates.dat.data.copy()
+
+    mesh = UnitSquareMesh(n, n)
+    mover = MongeAmpereMover(mesh, ring_monitor_numerical, method=method, rtol=tol)
+    mover.move()
+    if exports:
+        File("outputs/numerical.pvd").write(mover.phi, mover.sigma)
+    assert np.allclose(coords, mover.mesh.coordinates.dat.data)
+
+
+def test_symbolic_monitor(method, exports=False):
+    """
+    Test that caching the expression of a symbolic monitor
+    function gives the same result as re-evaluating it, and
+    that the cache is rebuilt when the monitor is changed.
+    """
+    n = 20
+    tol = 1.0e-03
+
+    mesh = UnitSquareMesh(n, n)
+    mover = MongeAmpereMover(mesh, ring_monitor, method=method, rtol=tol)
+    mover.move()
+    coords = mover.mesh.coordinates.dat.data.copy()
+
+    # Adapt to a ring monitor
+    mesh = UnitSquareMesh(n, n)
+    orig_coords = mesh.coordinates.dat.data.copy()
+    mover = MongeAmpereMover(
+        mesh, ring_monitor, method=method, rtol=tol, symbolic_monitor=True
+    )
+    mover.move()
+    if exports:
+        File("outputs/symbolic.pvd").write(mover.phi, mover.sigma)
+    assert np.allclose(coords, mover.mesh.coordinates.dat.data)
+
+    # Adapt to a constant monitor
+    mover.monitor_function = const_monitor
+    mover.move()
+    assert np.allclose(orig_coords, mover.mesh.coordinates.dat.data, atol=tol)
+
+
+def test_anderson_acceleration(exports=False):
+    """
+    Test that Anderson acceleration reduces the number
+    of iterations of the relaxation method, without
+    changing the mesh it converges to.
+    """
+    n = 20
+    rtol = 1.0e-03
+
+    mesh = UnitSquareMesh(n, n)
+    mover = MongeAmpereMover(mesh, ring_monitor, rtol=rtol)
+    num_it_naive = mover.move()
+    coords = mover.mesh.coordinates.dat.data.copy()
+
+    mesh = UnitSquareMesh(n, n)
+    orig_coords = mesh.coordinates.dat.data.copy()
+    mover = MongeAmpereMover(mesh, ring_monitor, rtol=rtol, anderson_depth=3)
+    num_it_anderson = mover.move()
+    if exports:
+        File("outputs/anderson.pvd").write(mover.phi, mover.sigma)
+
+    assert num_it_anderson < num_it_naive
+    assert np.allclose(coords, mover.mesh.coordinates.dat.data, atol=rtol)
+
+    # Check the history is reset when adapting to a constant monitor
+    mover.monitor_function = const_monitor
+    mover.move()
+    assert np.allclose(orig_coords, mover.mesh.coordinates.dat.data, atol=rtol)
+
+
+def test_anderson_depth_error():
+    """
+    Test that a negative Anderson depth is rejected.
+    """
+    mesh = UnitSquareMesh(10, 10)
+    with pytest.raises(ValueError) as e_info:
+        MongeAmpereMover(mesh, ring_monitor, anderson_depth=-1)
+    msg = "Anderson depth must be non-negative, not -1."
+    assert str(e_info.value) == msg
+
+
+def test_matfree(exports=False):
+    """
+    Test that applying the pseudo-timestepper operator
+    matrix-free gives the same result as assembling it.
+    """
+    n = 20
+    rtol = 1.0e-03
+
+    mesh = UnitSquareMesh(n, n)
+    mover = MongeAmpereMover(mesh, ring_monitor, rtol=rtol)
+    mover.move()
+    coords = mover.mesh.coordinates.dat.data.copy()
+
+    mesh = UnitSquareMesh(n, n)
+    mover = MongeAmpereMover(mesh, ring_monitor, rtol=rtol, matfree=True)
+    mover.move()
+    if exports:
+        File("outputs/matfree.pvd").write(mover.phi, mover.sigma)
+
+    assert np.allclose(coords, mover.mesh.coordinates.dat.data, atol=rtol)
+
+
+def test_offload_parameters():
+    """
+    Test that offloading wraps the GAMG preconditioner of
+    the pseudo-timestepper in an offloading preconditioner.
+    """
+    mesh = UnitSquareMesh(10, 10)
+    mover = MongeAmpereMover(mesh, const_monitor, offload=True)
+    parameters = mover.pseudotimestepper.parameters
+    assert parameters["pc_type"] == "python"
+    assert parameters["pc_python_type"] == "firedrake.OffloadPC"
+    assert parameters["offload_pc_type"] == "gamg"
+    assert parameters["offload_mg_levels_pc_type"] == "jacobi"
+    assert "offload_mat_type" not in parameters
+    assert "pc_gamg_type" not in parameters
+
+
+def test_print_freq(method, capfd):
+    """
+    Test that progress is only printed every `print_freq`
+    iterations, and on convergence.
+    """
+    n = 20
+    print_freq = 5
+    mesh = UnitSquareMesh(n, n)
+    mover = MongeAmpereMover(
+        mesh, ring_monitor, method=method, rtol=1.0e-03, print_freq=print_freq
+    )
+    num_iterations = mover.move()
+
+    # PETSc prints at the C level, so capture by file descriptor
+    out = capfd.readouterr().out
+    printed = [int(line.split()[0]) for line in out.splitlines() if "Residual" in line]
+    expected = list(range(0, num_iterations, print_freq)) + [num_iterations]
+    assert printed == expected
+
+
+def test_print_freq_error():
+    """
+    Test that a non-positive print frequency is rejected.
+    """
+    mesh = UnitSquareMesh(10, 10)
+    with pytest.raises(ValueError) as e_info:
+        MongeAmpereMover(mesh, ring_monitor, print_freq=0)
+    msg = "Print frequency must be a positive integer, not 0."
+    assert str(e_info.value) == msg
+
+
+@pytest.mark.parametrize("quadrilateral", [False, True])
+def test_boundary_normal_integrals(quadrilateral):
+    """
+    Test that the boundary normal integrals computed with a
+    single trace space assembly match those assembled for
+    each boundary segment and component separately.
+    """
+    mesh = UnitSquareMesh(10, 10, quadrilateral=quadrilateral)
+    mover = MongeAmpereMover(mesh, const_monitor, fix_boundary_nodes=True)
+    normals = mover._boundary_normal_integrals()
+
+    n = FacetNormal(mesh)
+    tags = mesh.exterior_facets.unique_markers
+    assert sorted(normals.keys()) == sorted(tags)
+    for i in tags:
+        expected = [assemble(abs(n[j]) * ds(i, domain=mesh)) for j in range(2)]
+        assert np.allclose(normals[i], expected)
+
+
 @pytest.mark.slow
 def test_bcs(method, fix_boundary):
     """